@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
+
+def _to_json(self) -> bytes:
+    return json.dumps(self.to_dict()).encode()
+
+
+def _parse_batch(cls, records: List[Dict[str, Any]]) -> List[Any]:
+    return list(map(cls._from_mapping, records))
+
 @dataclass(slots=True)
 class Telemetry:
     rotationAngle: float = 0.5
@@ -11,98 +21,171 @@ class Telemetry:
     altitude: int = 32000
     speed: int = 480
 
+    @classmethod
+    def _from_mapping(cls, data: Dict[str, Any]) -> Telemetry:
+        if len(data) == 5:
+            try:
+                args = (data['rotationAngle'], data['pitch'], data['roll'], data['altitude'], data['speed'])
+            except KeyError:
+                return cls(**data)
+            return cls(*args)
+        return cls(**data)
+
+    parse_batch = classmethod(_parse_batch)
+
+    @staticmethod
+    def to_columns(rows: List[Telemetry]) -> Dict[str, List[Any]]:
+        return {
+            'rotationAngle': list(map(attrgetter('rotationAngle'), rows)),
+            'pitch': list(map(attrgetter('pitch'), rows)),
+            'roll': list(map(attrgetter('roll'), rows)),
+            'altitude': list(map(attrgetter('altitude'), rows)),
+            'speed': list(map(attrgetter('speed'), rows)),
+        }
+
     def to_dict(self) -> Dict[str, Any]:
-        result = dict()
-        for key in self.__dataclass_fields__:
-            value = getattr(self, key)
-            if isinstance(value, list):
-                result[key] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in value]
-            elif hasattr(value, 'to_dict'):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
-        return result
+        return {
+            'rotationAngle': self.rotationAngle,
+            'pitch': self.pitch,
+            'roll': self.roll,
+            'altitude': self.altitude,
+            'speed': self.speed,
+        }
+
+    to_json = _to_json
 
 @dataclass(slots=True)
 class GpsCoordinates:
     latitude: float = 40.4168
     longitude: float = -3.7038
 
+    @classmethod
+    def _from_mapping(cls, data: Dict[str, Any]) -> GpsCoordinates:
+        if len(data) == 2:
+            try:
+                args = (data['latitude'], data['longitude'])
+            except KeyError:
+                return cls(**data)
+            return cls(*args)
+        return cls(**data)
+
+    parse_batch = classmethod(_parse_batch)
+
+    @staticmethod
+    def to_columns(rows: List[GpsCoordinates]) -> Dict[str, List[Any]]:
+        return {
+            'latitude': list(map(attrgetter('latitude'), rows)),
+            'longitude': list(map(attrgetter('longitude'), rows)),
+        }
+
     def to_dict(self) -> Dict[str, Any]:
-        result = dict()
-        for key in self.__dataclass_fields__:
-            value = getattr(self, key)
-            if isinstance(value, list):
-                result[key] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in value]
-            elif hasattr(value, 'to_dict'):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
-        return result
+        return {
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+        }
+
+    to_json = _to_json
 
 @dataclass(slots=True)
 class Coordinates:
     lat: float = 40.4983
     lon: float = -3.5676
 
+    @classmethod
+    def _from_mapping(cls, data: Dict[str, Any]) -> Coordinates:
+        if len(data) == 2:
+            try:
+                args = (data['lat'], data['lon'])
+            except KeyError:
+                return cls(**data)
+            return cls(*args)
+        return cls(**data)
+
+    parse_batch = classmethod(_parse_batch)
+
+    @staticmethod
+    def to_columns(rows: List[Coordinates]) -> Dict[str, List[Any]]:
+        return {
+            'lat': list(map(attrgetter('lat'), rows)),
+            'lon': list(map(attrgetter('lon'), rows)),
+        }
+
     def to_dict(self) -> Dict[str, Any]:
-        result = dict()
-        for key in self.__dataclass_fields__:
-            value = getattr(self, key)
-            if isinstance(value, list):
-                result[key] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in value]
-            elif hasattr(value, 'to_dict'):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
-        return result
+        return {
+            'lat': self.lat,
+            'lon': self.lon,
+        }
+
+    to_json = _to_json
 
 @dataclass(slots=True)
 class RoutePoint:
     id: str = 'WPT01'
     name: str = 'Barajas'
-    coordinates: Coordinates = field(default_factory=lambda: {'lat': 40.4983, 'lon': -3.5676})
+    coordinates: Coordinates = field(default_factory=Coordinates)
     def __post_init__(self) -> None:
         if isinstance(self.coordinates, dict):
-            self.coordinates = Coordinates(**self.coordinates)
+            self.coordinates = Coordinates._from_mapping(self.coordinates)
+
+    @classmethod
+    def _from_mapping(cls, data: Dict[str, Any]) -> RoutePoint:
+        if len(data) == 3:
+            try:
+                args = (data['id'], data['name'], data['coordinates'])
+            except KeyError:
+                return cls(**data)
+            return cls(*args)
+        return cls(**data)
+
+    parse_batch = classmethod(_parse_batch)
 
     def to_dict(self) -> Dict[str, Any]:
-        result = dict()
-        for key in self.__dataclass_fields__:
-            value = getattr(self, key)
-            if isinstance(value, list):
-                result[key] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in value]
-            elif hasattr(value, 'to_dict'):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
-        return result
+        return {
+            'id': self.id,
+            'name': self.name,
+            'coordinates': self.coordinates.to_dict() if self.coordinates is not None else None,
+        }
+
+    to_json = _to_json
 
 @dataclass(slots=True)
 class Aeronautical:
     flightId: str = 'IB3456'
     aircraftModel: str = 'Airbus A350'
     status: str = 'in_flight'
-    telemetry: Telemetry = field(default_factory=lambda: {'rotationAngle': 0.5, 'pitch': 2.3, 'roll': -1.2, 'altitude': 32000, 'speed': 480})
-    gpsCoordinates: GpsCoordinates = field(default_factory=lambda: {'latitude': 40.4168, 'longitude': -3.7038})
+    telemetry: Telemetry = field(default_factory=Telemetry)
+    gpsCoordinates: GpsCoordinates = field(default_factory=GpsCoordinates)
     numberRoutePoints: int = 2
-    routePoints: List[RoutePoint] = field(default_factory=lambda: [{'id': 'WPT01', 'name': 'Barajas', 'coordinates': {'lat': 40.4983, 'lon': -3.5676}}, {'id': 'WPT02', 'name': 'Zaragoza', 'coordinates': {'lat': 41.6488, 'lon': -0.8891}}])
+    routePoints: List[RoutePoint] = field(default_factory=lambda: [RoutePoint(id='WPT01', name='Barajas', coordinates=Coordinates(lat=40.4983, lon=-3.5676)), RoutePoint(id='WPT02', name='Zaragoza', coordinates=Coordinates(lat=41.6488, lon=-0.8891))])
     def __post_init__(self) -> None:
         if isinstance(self.telemetry, dict):
-            self.telemetry = Telemetry(**self.telemetry)
+            self.telemetry = Telemetry._from_mapping(self.telemetry)
         if isinstance(self.gpsCoordinates, dict):
-            self.gpsCoordinates = GpsCoordinates(**self.gpsCoordinates)
-        if isinstance(self.routePoints, list) and self.routePoints and isinstance(self.routePoints[0], dict):
-            self.routePoints = [RoutePoint(**item) for item in self.routePoints]
+            self.gpsCoordinates = GpsCoordinates._from_mapping(self.gpsCoordinates)
+        if isinstance(self.routePoints, (list, tuple)) and self.routePoints and isinstance(self.routePoints[0], dict):
+            self.routePoints = RoutePoint.parse_batch(self.routePoints)
+
+    @classmethod
+    def _from_mapping(cls, data: Dict[str, Any]) -> Aeronautical:
+        if len(data) == 7:
+            try:
+                args = (data['flightId'], data['aircraftModel'], data['status'], data['telemetry'], data['gpsCoordinates'], data['numberRoutePoints'], data['routePoints'])
+            except KeyError:
+                return cls(**data)
+            return cls(*args)
+        return cls(**data)
+
+    parse_batch = classmethod(_parse_batch)
 
     def to_dict(self) -> Dict[str, Any]:
-        result = dict()
-        for key in self.__dataclass_fields__:
-            value = getattr(self, key)
-            if isinstance(value, list):
-                result[key] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in value]
-            elif hasattr(value, 'to_dict'):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
-        return result
+        return {
+            'flightId': self.flightId,
+            'aircraftModel': self.aircraftModel,
+            'status': self.status,
+            'telemetry': self.telemetry.to_dict() if self.telemetry is not None else None,
+            'gpsCoordinates': self.gpsCoordinates.to_dict() if self.gpsCoordinates is not None else None,
+            'numberRoutePoints': self.numberRoutePoints,
+            'routePoints': [item.to_dict() for item in self.routePoints] if self.routePoints is not None else None,
+        }
+
+    to_json = _to_json
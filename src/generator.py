@@ -9,25 +9,122 @@ dataclasses that mirror the JSON schema. The generator:
 - Emits dataclasses with a `to_dict()` helper and a `__post_init__`
     that converts nested dicts/lists into the corresponding dataclass
     instances at runtime.
+- Optionally (`--numeric-arrays`) stores homogeneous int/float lists in
+    `array.array` fields (8 bytes per item instead of a boxed Python
+    number). These fields compare unequal to lists and only accept items
+    of their typecode, so the option is off by default.
+- Specializes each `to_dict()` at generation time: the body is a single
+    dict display with one statically-chosen expression per field instead
+    of a reflective loop over `__dataclass_fields__`.
 
 Usage (from project root):
 
-        python src/generator.py path/to/input.json
+        python src/generator.py path/to/input.json [--encoder {json,orjson,msgspec}]
+            [--parser {json,orjson,msgspec}] [--numeric-arrays]
 
 The generated file is written to `src/generated_class.py` by default.
 """
 
-import json
+import argparse
+import importlib
 import os
-import sys
-import hashlib
-from typing import Any, Dict, List, Union, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Union, Optional, Tuple
 
+# Parsers selectable with `--parser` for the input file: (module, function),
+# all of which accept the raw bytes of the file. orjson and msgspec are
+# several times faster than the stdlib on large inputs, but they do not read
+# every document the same way (orjson turns integers beyond 64 bits into
+# floats, both reject NaN and Infinity), so the stdlib stays the default.
+PARSERS = {
+    'json': ('json', 'loads'),
+    'orjson': ('orjson', 'loads'),
+    'msgspec': ('msgspec.json', 'decode'),
+}
+
+# Preamble shared by every generated module. `_to_json` and `_parse_batch`
+# are the same in every class, so they are compiled once here and bound in
+# each class body instead of being re-emitted per class.
+MODULE_HEADER = '''from __future__ import annotations
+
+{encoder_import}
+{array_import}from dataclasses import dataclass, field
+{attrgetter_import}from typing import Any, Dict, List, Optional
+
+
+{to_plain_helper}def _to_json(self) -> bytes:
+    return {encoder_call}
+
+
+def _parse_batch(cls, records: List[Dict[str, Any]]) -> List[Any]:
+    return list(map(cls._from_mapping, records))
+
+'''
+
+# Generic serializer for the fields whose shape cannot be pinned down from
+# the sample JSON (nulls, empty or mixed lists), added to the header only
+# when some `to_dict` falls back to it; every other field gets a specialized
+# expression. JSON scalars are recognised with one set lookup on their exact
+# type, and only other values are probed for a `to_dict` method, fetched
+# with a single getattr rather than a hasattr probe followed by a second
+# lookup.
+TO_PLAIN_HELPER = '''_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _to_plain(value: Any) -> Any:
+    if type(value) in _PLAIN_TYPES:
+        return value
+    if isinstance(value, list):
+        return [
+            item if type(item) in _PLAIN_TYPES
+            else td() if (td := getattr(item, 'to_dict', None)) is not None
+            else item
+            for item in value
+        ]
+    td = getattr(value, 'to_dict', None)
+    if td is not None:
+        return td()
+    return value
+
+
+'''
+
+# JSON encoders selectable with `--encoder`: (import line, `_to_json` body).
+# orjson and msgspec serialize dataclasses natively, so they skip building
+# the intermediate `to_dict()` result altogether; `list` is their hook for
+# the array.array fields they do not know about.
+ENCODERS = {
+    'json': ('import json', 'json.dumps(self.to_dict()).encode()'),
+    'orjson': ('import orjson', 'orjson.dumps(self, default=list)'),
+    'msgspec': ('import msgspec', 'msgspec.json.encode(self, enc_hook=list)'),
+}
+
+# Type strings for values whose type is unknown from the sample. infer_type
+# flags them as optional alongside the type string, so generate_class never
+# has to inspect the string itself.
+_T_ANY = 'Any'
+_T_OPTIONAL_ANY = 'Optional[Any]'
+
+# Type strings of the JSON scalars, keyed by their exact Python type, as they
+# appear inside containers (a null list item is `Optional[Any]`)
+_SCALAR_TYPES = {
+    bool: 'bool',
+    int: 'int',
+    float: 'float',
+    str: 'str',
+    type(None): _T_OPTIONAL_ANY,
+}
+
+# Exact types of the JSON scalars that become plain typed fields
+_JSON_SCALARS = frozenset(_SCALAR_TYPES) - {type(None)}
+
+@lru_cache(maxsize=4096)
 def to_pascal_case(text: str) -> str:
     """
     Converts a string to PascalCase.
     
     Handles both snake_case (e.g., 'my_variable') and camelCase (e.g., 'myVariable').
+    Results are memoized, since the same field names recur across the tree.
     
     Args:
         text (str): The input string.
@@ -39,11 +136,12 @@ def to_pascal_case(text: str) -> str:
         return ''.join(x.title() for x in text.split('_'))
     return text[0].upper() + text[1:]
 
+@lru_cache(maxsize=4096)
 def get_singular_name(name: str) -> str:
     """
     Simple heuristic to singularize a word.
     
-    Currently just removes the trailing 's' if present.
+    Currently just removes the trailing 's' if present. Results are memoized.
     
     Args:
         name (str): The plural name.
@@ -55,7 +153,28 @@ def get_singular_name(name: str) -> str:
         return name[:-1]
     return name
 
-def infer_type(value: Any, classes: Dict[str, str], structure_map: Dict[str, str], name_counts: Dict[str, int], field_name: str = None) -> str:
+def get_array_typecode(items: List[Any]) -> Optional[str]:
+    """
+    Returns the `array.array` typecode able to store a homogeneous numeric list.
+
+    Lists made only of ints that fit in a signed 64-bit integer map to 'q' and
+    lists made only of floats map to 'd'. Booleans, mixed or empty lists are
+    left as regular Python lists.
+
+    Args:
+        items (List[Any]): The JSON list.
+
+    Returns:
+        Optional[str]: The typecode, or None if the list must stay a list.
+    """
+    item_types = {type(item) for item in items}
+    if item_types == {int} and all(-2**63 <= item < 2**63 for item in items):
+        return 'q'
+    if item_types == {float}:
+        return 'd'
+    return None
+
+def infer_type(value: Any, classes: Dict[str, str], structure_map: Dict[frozenset, str], name_counts: Dict[str, int], field_name: str = None, numeric_arrays: bool = False) -> Tuple[str, bool]:
     """
     Infers the Python type string for a given JSON value and handles nested class generation.
 
@@ -65,57 +184,66 @@ def infer_type(value: Any, classes: Dict[str, str], structure_map: Dict[str, str
     Args:
         value (Any): The value to infer the type for.
         classes (Dict[str, str]): A dictionary accumulating the generated class code (name -> code).
-        structure_map (Dict[str, str]): A map of {sorted_keys_string -> class_name} to detect duplicate structures.
+        structure_map (Dict[frozenset, str]): A map of {structural signature -> class_name} to detect duplicate structures.
         name_counts (Dict[str, int]): A counter to handle name collisions (e.g., Telemetry, Telemetry2).
         field_name (str, optional): The name of the field this value belongs to. Used for naming generated classes.
+        numeric_arrays (bool, optional): Whether nested classes store numeric lists in `array.array` fields.
 
     Returns:
-        str: The Python type string (e.g., 'int', 'List[str]', 'MyClass').
+        Tuple[str, bool]: The Python type string (e.g., 'int', 'List[str]', 'MyClass')
+            and whether the field must be annotated as Optional (nulls and
+            values of unknown type).
     """
-    # Primitive types
-    if isinstance(value, bool):
-        return 'bool'
-    elif isinstance(value, int):
-        return 'int'
-    elif isinstance(value, float):
-        return 'float'
-    elif isinstance(value, str):
-        return 'str'
-    elif value is None:
-        return 'Optional[Any]'
+    if value is None:
+        return _T_ANY, True
+    # Primitive types: a single lookup on the exact type (which also keeps
+    # bool apart from its int base class)
+    scalar_type = _SCALAR_TYPES.get(type(value))
+    if scalar_type is not None:
+        return scalar_type, False
     elif isinstance(value, list):
         if not value:
-            return 'List[Any]'
+            return 'List[Any]', False
         
         # Determine singular name for items (used for naming item classes)
         item_name = None
         if field_name:
             item_name = get_singular_name(field_name)
             
-        # Collect all unique types in the list
-        types = set()
-        for item in value:
-            types.add(infer_type(item, classes, structure_map, name_counts, field_name=item_name))
+        # Fast path for the common homogeneous scalar list: one exact-type
+        # scan, with no per-item lookup or set building
+        first_type = type(value[0])
+        if first_type in _SCALAR_TYPES and all(type(item) is first_type for item in value):
+            return f'List[{_SCALAR_TYPES[first_type]}]', False
+
+        def container_type(item: Any) -> str:
+            item_type, item_optional = infer_type(item, classes, structure_map, name_counts, field_name=item_name, numeric_arrays=numeric_arrays)
+            return f'Optional[{item_type}]' if item_optional else item_type
+
+        # Collect all unique types in the list. Scalar items are resolved
+        # inline from the table; only containers recurse (and may generate
+        # classes), so scalar-heavy lists cost no call frame per element.
+        # The lookup is bound locally and the set built by a comprehension.
+        scalar_lookup = _SCALAR_TYPES.get
+        types = {scalar_lookup(type(item)) or container_type(item) for item in value}
         
         if len(types) == 1:
-            return f'List[{list(types)[0]}]'
+            return f'List[{list(types)[0]}]', False
         else:
             union_types = ' | '.join(sorted(types))
-            return f'List[{union_types}]'
+            return f'List[{union_types}]', False
     elif isinstance(value, dict):
         # For object values, derive a signature based on the keys and the
         # types of their values (not the concrete values). This lets us
         # deduplicate classes that share the same structure but different
-        # data.
-        structure_sig = json.dumps(
-            {k: type(v).__name__ for k, v in sorted(value.items())},
-            sort_keys=True,
-        )
-        dict_hash = hashlib.md5(structure_sig.encode()).hexdigest()[:8]
+        # data. The frozenset itself is the lookup key: it hashes in C in
+        # O(k) without sorting (keys are unique, so no pair is lost) and,
+        # unlike a truncated digest, cannot collide.
+        structure_sig = frozenset((k, type(v).__name__) for k, v in value.items())
 
         # Reuse class name if this structural signature was already seen
-        if dict_hash in structure_map:
-            return structure_map[dict_hash]
+        if structure_sig in structure_map:
+            return structure_map[structure_sig], False
 
         # Derive a human-friendly base name from the field name if present
         base_name = "GeneratedClass"
@@ -124,133 +252,336 @@ def infer_type(value: Any, classes: Dict[str, str], structure_map: Dict[str, str
             if base_name and base_name[0].islower():
                 base_name = base_name[0].upper() + base_name[1:]
 
-        # Ensure uniqueness against already used class names
+        # Ensure uniqueness against already used class names. Every name is
+        # registered in name_counts before its code lands in classes, so one
+        # lookup covers both.
         class_name = base_name
         counter = 0
         original_base = base_name
-        while class_name in classes or class_name in name_counts:
+        while class_name in name_counts:
             counter += 1
             class_name = f"{original_base}{counter}"
 
         # Register the structural signature before generating the body to
         # correctly handle recursive structures.
-        structure_map[dict_hash] = class_name
-        if class_name not in name_counts:
-            name_counts[class_name] = 0
+        structure_map[structure_sig] = class_name
+        name_counts[class_name] = 0
 
-        classes[class_name] = generate_class(value, class_name, classes, structure_map, name_counts)
-        return class_name
+        classes[class_name] = generate_class(value, class_name, classes, structure_map, name_counts, numeric_arrays=numeric_arrays)
+        return class_name, False
     else:
-        return 'Any'
+        return _T_ANY, True
+
+def build_default_expr(value: Any, classes: Dict[str, str], structure_map: Dict[frozenset, str], name_counts: Dict[str, int], field_name: str = None, class_name: str = None, numeric_arrays: bool = False) -> str:
+    """
+    Builds the Python expression that creates the default value of a field.
+
+    Nested objects, and objects directly inside lists, become constructor
+    calls of their generated class (recursively), so creating a default
+    instance never allocates intermediate dicts that `__post_init__` then
+    has to convert again. Lists nested in lists are kept as plain literals,
+    mirroring what `__post_init__` and `to_dict` handle.
+
+    Args:
+        value (Any): The JSON value used as default.
+        classes (Dict[str, str]): Dictionary of generated class code.
+        structure_map (Dict[frozenset, str]): Map for structural deduplication.
+        name_counts (Dict[str, int]): Counter for name collision resolution.
+        field_name (str, optional): The name of the field this value belongs to.
+        class_name (str, optional): The class already inferred for a dict `value`,
+            which saves looking it up again.
+        numeric_arrays (bool, optional): Build numeric lists as `array.array`.
+
+    Returns:
+        str: A Python expression evaluating to the default value.
+    """
+    if isinstance(value, dict):
+        if class_name is None:
+            class_name, _ = infer_type(value, classes, structure_map, name_counts, field_name=field_name, numeric_arrays=numeric_arrays)
+        args = ', '.join(
+            f'{key}={build_default_expr(item, classes, structure_map, name_counts, field_name=key, numeric_arrays=numeric_arrays)}'
+            for key, item in value.items()
+        )
+        return f'{class_name}({args})'
+    if isinstance(value, list):
+        typecode = get_array_typecode(value) if numeric_arrays else None
+        if typecode:
+            return f'array({typecode!r}, {value!r})'
+        item_name = get_singular_name(field_name) if field_name else None
+        items = ', '.join(
+            repr(item) if isinstance(item, list)
+            else build_default_expr(item, classes, structure_map, name_counts, field_name=item_name, numeric_arrays=numeric_arrays)
+            for item in value
+        )
+        return f'[{items}]'
+    return repr(value)
 
-def generate_class(json_data: Dict[str, Any], class_name: str, classes: Dict[str, str], structure_map: Dict[str, str], name_counts: Dict[str, int]) -> str:
+def generate_class(json_data: Dict[str, Any], class_name: str, classes: Dict[str, str], structure_map: Dict[frozenset, str], name_counts: Dict[str, int], numeric_arrays: bool = False) -> str:
     """
     Generates the Python code for a dataclass based on a JSON dictionary.
 
     Iterates through the dictionary keys to define fields and their types.
-    Also adds a `to_dict` method to the generated class for serialization.
-    Includes __post_init__ to convert nested dicts to class instances.
+    Also adds a `to_dict` method to the generated class for serialization,
+    specialized per field from the statically-known type (scalar, nested
+    class, list of nested classes, list of scalars), and a `to_json` method
+    backed by the encoder chosen for the module.
+    Includes __post_init__ to convert nested dicts to class instances through
+    a `_from_mapping` classmethod that passes the known keys positionally, and
+    a `parse_batch` classmethod that converts a whole list of records.
+    Scalar-only classes also get a `to_columns` staticmethod that turns a
+    list of instances into one list per field.
 
     Args:
         json_data (Dict[str, Any]): The JSON data defining the class structure.
         class_name (str): The name of the class to generate.
         classes (Dict[str, str]): Dictionary to store generated class code.
-        structure_map (Dict[str, str]): Map for structural deduplication.
+        structure_map (Dict[frozenset, str]): Map for structural deduplication.
         name_counts (Dict[str, int]): Counter for name collision resolution.
+        numeric_arrays (bool, optional): Store homogeneous int/float lists in
+            `array.array` fields.
 
     Returns:
         str: The complete Python code string for the generated class.
     """
-    fields = []
+    # One annotation line and one to_dict entry per key: allocate both lists
+    # at their final size up front
+    fields = [None] * len(json_data)
     post_init_conversions = []
+    to_dict_entries = [None] * len(json_data)
     
-    for key, value in json_data.items():
-        typ = infer_type(value, classes, structure_map, name_counts, field_name=key)
+    for i, (key, value) in enumerate(json_data.items()):
+        known_structures = len(structure_map)
+        typ, is_optional = infer_type(value, classes, structure_map, name_counts, field_name=key, numeric_arrays=numeric_arrays)
         default_str = ""
-        if isinstance(value, (str, int, float, bool)):
+        # Fields whose shape is unknown at generation time fall back to the
+        # generic `_to_plain` helper emitted in the module header.
+        encoded = f"_to_plain(self.{key})"
+        # One exact-type lookup per field instead of an isinstance chain
+        value_type = type(value)
+        if value_type in _JSON_SCALARS:
             default_str = f" = {repr(value)}"
-        elif isinstance(value, list):
+            encoded = f"self.{key}"
+        elif value_type is list:
             if value:
-                # For lists, store raw data as default and convert in __post_init__
-                default_str = f" = field(default_factory=lambda: {repr(value)})"
+                # For lists, build the items directly as default; __post_init__
+                # still converts lists of dicts supplied by the caller. Each
+                # scan of the items runs once and is reused below.
+                typecode = get_array_typecode(value) if numeric_arrays else None
+                scalars_only = not any(type(item) in (dict, list) for item in value)
+                default_expr = build_default_expr(value, classes, structure_map, name_counts, field_name=key, numeric_arrays=numeric_arrays)
+                if scalars_only and not typecode:
+                    # Scalars only: the literal is built once as a blueprint and
+                    # its bound (C-level) copy method is the factory, so no
+                    # lambda frame runs and no literal is rebuilt per instance
+                    default_str = f" = field(default_factory={default_expr}.copy)"
+                else:
+                    default_str = f" = field(default_factory=lambda: {default_expr})"
                 # Extract item class name from List[ClassName]
-                if isinstance(value[0], dict):
+                if type(value[0]) is dict:
                     item_type = typ[5:-1] if typ.startswith('List[') else 'dict'
-                    post_init_conversions.append((key, item_type, True))  # True = is_list
+                    post_init_conversions.append((key, item_type, 'list'))
+                if typecode:
+                    # Opt-in: homogeneous numbers are stored unboxed in an
+                    # array.array; caller-supplied lists are packed in
+                    # __post_init__ when the typecode can hold them
+                    typ = 'array[int]' if typecode == 'q' else 'array[float]'
+                    post_init_conversions.append((key, typecode, 'array'))
+                # None stays a valid value for every field, as in the generic
+                # `_to_plain` path, so it is serialized as-is
+                if all(type(item) is dict for item in value) and ' | ' not in typ:
+                    encoded = f"[item.to_dict() for item in self.{key}] if self.{key} is not None else None"
+                elif scalars_only:
+                    encoded = f"list(self.{key}) if self.{key} is not None else None"
             else:
                 default_str = " = field(default_factory=list)"
-        elif isinstance(value, dict):
-            # For nested objects, store raw data as default and convert in __post_init__
-            sub_class_name = infer_type(value, classes, structure_map, name_counts, field_name=key)
-            default_str = f" = field(default_factory=lambda: {repr(value)})"
-            post_init_conversions.append((key, sub_class_name, False))  # False = not is_list
+        elif value_type is dict:
+            # For nested objects, build the instance directly as default; __post_init__
+            # still converts dicts supplied by the caller
+            # `typ` already is the nested class name; inferring again would
+            # re-walk the subtree and recompute its structural signature
+            sub_class_name = typ
+            if len(structure_map) > known_structures:
+                # The class was generated from this very value, so its own
+                # field defaults already reproduce it: the class itself is
+                # the factory, with no lambda frame or keyword binding.
+                default_str = f" = field(default_factory={sub_class_name})"
+            else:
+                default_expr = build_default_expr(value, classes, structure_map, name_counts, field_name=key, class_name=sub_class_name, numeric_arrays=numeric_arrays)
+                default_str = f" = field(default_factory=lambda: {default_expr})"
+            post_init_conversions.append((key, sub_class_name, 'object'))
+            encoded = f"self.{key}.to_dict() if self.{key} is not None else None"
         elif value is None:
             default_str = " = None"
+        to_dict_entries[i] = f"            {key!r}: {encoded},"
         
-        if 'Optional' in typ or typ == 'Any':
+        if is_optional:
             typ = f'Optional[{typ}]'
-        fields.append(f'    {key}: {typ}{default_str}')
+        fields[i] = f'    {key}: {typ}{default_str}'
     
     # Build __post_init__ method if needed
     post_init_code = ""
     if post_init_conversions:
         post_init_lines = ["    def __post_init__(self) -> None:"]
-        for field_name, nested_class_name, is_list in post_init_conversions:
-            if is_list:
-                post_init_lines.append(f"        if isinstance(self.{field_name}, list) and self.{field_name} and isinstance(self.{field_name}[0], dict):")
-                post_init_lines.append(f"            self.{field_name} = [{nested_class_name}(**item) for item in self.{field_name}]")
+        for field_name, target, kind in post_init_conversions:
+            if kind == 'list':
+                post_init_lines.append(f"        if isinstance(self.{field_name}, (list, tuple)) and self.{field_name} and isinstance(self.{field_name}[0], dict):")
+                post_init_lines.append(f"            self.{field_name} = {target}.parse_batch(self.{field_name})")
+            elif kind == 'array':
+                # Values the typecode cannot hold (floats in an int array,
+                # ints beyond 64 bits) leave the caller's list untouched
+                post_init_lines += [
+                    f"        if isinstance(self.{field_name}, (list, tuple)):",
+                    "            try:",
+                    f"                self.{field_name} = array({target!r}, self.{field_name})",
+                    "            except (TypeError, OverflowError):",
+                    "                pass",
+                ]
             else:
                 post_init_lines.append(f"        if isinstance(self.{field_name}, dict):")
-                post_init_lines.append(f"            self.{field_name} = {nested_class_name}(**self.{field_name})")
+                post_init_lines.append(f"            self.{field_name} = {target}._from_mapping(self.{field_name})")
         post_init_code = "\n" + "\n".join(post_init_lines)
+
+    # Positional construction from a mapping holding exactly the known keys;
+    # anything else (missing or extra keys) takes the keyword path so the
+    # dataclass __init__ keeps reporting errors as before.
+    method_lines = [
+        "    @classmethod",
+        f"    def _from_mapping(cls, data: Dict[str, Any]) -> {class_name}:",
+    ]
+    if json_data:
+        # Only the key lookups sit in the try: a KeyError raised by the
+        # constructor itself must propagate, not rebuild the instance
+        args = ", ".join(f"data[{key!r}]" for key in json_data)
+        trailing_comma = "," if len(json_data) == 1 else ""
+        method_lines += [
+            f"        if len(data) == {len(json_data)}:",
+            "            try:",
+            f"                args = ({args}{trailing_comma})",
+            "            except KeyError:",
+            "                return cls(**data)",
+            "            return cls(*args)",
+        ]
+    method_lines.append("        return cls(**data)")
+    # Bulk ingestion of many records: map() drives the per-record calls from C
+    method_lines += [
+        "",
+        "    parse_batch = classmethod(_parse_batch)",
+    ]
+    # Scalar-only (leaf) classes can hand a list of rows out column-wise,
+    # one contiguous list per field, ready for aggregation or NumPy; each
+    # column is read by a C-level attrgetter driven by map()
+    if json_data and not any(isinstance(v, (dict, list)) for v in json_data.values()):
+        method_lines += [
+            "",
+            "    @staticmethod",
+            f"    def to_columns(rows: List[{class_name}]) -> Dict[str, List[Any]]:",
+            "        return {",
+            *(f"            {key!r}: list(map(attrgetter({key!r}), rows))," for key in json_data),
+            "        }",
+        ]
+    methods_code = "\n".join(method_lines)
+
+    # Single dict display: one straight-line expression per field
+    if to_dict_entries:
+        to_dict_body = "        return {\n" + "\n".join(to_dict_entries) + "\n        }"
+    else:
+        to_dict_body = "        return {}"
     
+    fields_code = "\n".join(fields)
+    # slots=True rather than a literal `__slots__` in the body: every field
+    # carries a class-level default, which a hand-written `__slots__` entry of
+    # the same name rejects with "conflicts with class variable".
     class_code = f'''@dataclass(slots=True)
 class {class_name}:
-{chr(10).join(fields)}{post_init_code}
+{fields_code}{post_init_code}
+
+{methods_code}
 
     def to_dict(self) -> Dict[str, Any]:
-        result = dict()
-        for key in self.__dataclass_fields__:
-            value = getattr(self, key)
-            if isinstance(value, list):
-                result[key] = [item.to_dict() if hasattr(item, 'to_dict') else item for item in value]
-            elif hasattr(value, 'to_dict'):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
-        return result
+{to_dict_body}
+
+    to_json = _to_json
 '''
     return class_code
 
-def main(input_json_path: str = None):
+def build_module_header(encoder: str, class_codes: List[str]) -> str:
+    """
+    Builds the preamble of a generated module.
+
+    Optional imports and helpers are only included when some generated class
+    references them, so the module carries no unused code.
+
+    Args:
+        encoder (str): Library backing the generated `to_json` methods, one of `ENCODERS`.
+        class_codes (List[str]): The code of every generated class.
+
+    Returns:
+        str: The module header.
+    """
+    def uses(token: str) -> bool:
+        return any(token in code for code in class_codes)
+
+    encoder_import, encoder_call = ENCODERS[encoder]
+    return MODULE_HEADER.format(
+        encoder_import=encoder_import,
+        encoder_call=encoder_call,
+        # Only present with `numeric_arrays`, and then only if a list qualified
+        array_import='from array import array\n' if uses(' = array(') else '',
+        attrgetter_import='from operator import attrgetter\n' if uses('def to_columns(') else '',
+        to_plain_helper=TO_PLAIN_HELPER if uses('_to_plain(self.') else '',
+    )
+
+def main(input_json_path: str = None, encoder: str = 'json', return_source: bool = False, numeric_arrays: bool = False, json_parser: str = 'json') -> Optional[str]:
     """
     Main execution entry point.
 
-    1. Determines input JSON path (arg or default).
+    1. Determines input JSON path, encoder and parser (args or defaults).
     2. Loads JSON data.
     3. Generates the 'Root' class and all dependency classes.
-    4. Writes the result to 'generated_class.py'.
+    4. Writes the result to 'generated_class.py', or returns it.
 
     Args:
         input_json_path (str, optional): Path to the input JSON file.
+        encoder (str, optional): Library backing the generated `to_json`
+            methods, one of `ENCODERS` ('json', 'orjson' or 'msgspec').
+        return_source (bool, optional): Return the generated module source
+            instead of writing it to disk, so callers can compile and exec
+            it in memory.
+        numeric_arrays (bool, optional): Store homogeneous int/float lists in
+            `array.array` fields instead of lists.
+        json_parser (str, optional): Library reading the input file, one of
+            `PARSERS` ('json', 'orjson' or 'msgspec').
+
+    Returns:
+        Optional[str]: The generated source when `return_source` is set.
     """
     if input_json_path is None:
-        if len(sys.argv) > 1:
-            input_json_path = sys.argv[1]
-        else:
-            input_json_path = os.path.join(os.path.dirname(__file__), '..', 'default.json')
+        parser = argparse.ArgumentParser(description='Generate Python dataclasses from a JSON file.')
+        parser.add_argument('input_json_path', nargs='?',
+                            default=os.path.join(os.path.dirname(__file__), '..', 'default.json'))
+        parser.add_argument('--encoder', choices=sorted(ENCODERS), default=encoder,
+                            help='library used by the generated to_json() methods')
+        parser.add_argument('--numeric-arrays', action='store_true', default=numeric_arrays,
+                            help='store homogeneous int/float lists in array.array fields')
+        parser.add_argument('--parser', choices=sorted(PARSERS), default=json_parser,
+                            help='library used to read the input JSON file')
+        args = parser.parse_args()
+        input_json_path, encoder = args.input_json_path, args.encoder
+        numeric_arrays, json_parser = args.numeric_arrays, args.parser
     
     output_path = os.path.join(os.path.dirname(__file__), 'generated_class.py')
     
+    module_name, function_name = PARSERS[json_parser]
+    loads = getattr(importlib.import_module(module_name), function_name)
     try:
-        with open(input_json_path, 'r') as f:
-            json_data = json.load(f)
+        with open(input_json_path, 'rb') as f:
+            json_data = loads(f.read())
     except FileNotFoundError:
         print(f"Error: File not found at {input_json_path}")
         return
 
     classes = {}
-    structure_map = {} # Maps dict_key -> class_name
+    structure_map = {} # Maps structural signature -> class_name
     name_counts = {}   # Maps base_name -> count
     
     # Generate root class
@@ -259,22 +590,27 @@ def main(input_json_path: str = None):
     filename_no_ext = os.path.splitext(filename)[0]
     main_class_name = to_pascal_case(filename_no_ext)
     
-    main_class = generate_class(json_data, main_class_name, classes, structure_map, name_counts)
+    main_class = generate_class(json_data, main_class_name, classes, structure_map, name_counts, numeric_arrays=numeric_arrays)
     
     # Combine all classes
-    all_code = 'from __future__ import annotations\n\nfrom dataclasses import dataclass, field\nfrom typing import Any, Dict, List, Optional\n\n'
+    header = build_module_header(encoder, [*classes.values(), main_class])
     
     # Sort classes to ensure definition order (children before parents usually not strictly required in Python if using strings, 
     # but here we are not using string forward refs in type hints for the most part, except we might need to.
     # However, the current implementation puts main class at the end and deps in `classes`.
     # `classes` will contain all nested classes.
     
-    for class_name, class_code in classes.items():
-        all_code += class_code + '\n'
-    all_code += main_class
-    
+    if return_source:
+        return header + '\n'.join([*classes.values(), main_class])
+
+    # Streamed class by class into the (buffered) file: no concatenated copy
+    # of the whole module is ever built in memory.
     with open(output_path, 'w') as f:
-        f.write(all_code)
+        f.write(header)
+        for class_code in classes.values():
+            f.write(class_code)
+            f.write('\n')
+        f.write(main_class)
     
     print(f'Class generated successfully at {output_path}!')
 
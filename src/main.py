@@ -1,14 +1,58 @@
 import os
 import sys
 import json
+import types
+import hashlib
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-# Run generator with aeronautical.json
-import generator
 aeronautical_json_path = os.path.join(os.path.dirname(__file__), '..', 'aeronautical.json')
-generator.main(aeronautical_json_path)
+generator_path = os.path.join(os.path.dirname(__file__), 'generator.py')
+generated_path = os.path.join(os.path.dirname(__file__), 'generated_class.py')
+# Sidecar holding the hashes of the input the generated module was built
+# from and of the generated source itself (which `generator.py` may have
+# since overwritten from another input)
+hash_path = os.path.join(os.path.dirname(__file__), 'generated_class.hash')
+
+with open(aeronautical_json_path, 'rb') as f:
+    input_digest = hashlib.blake2b(f.read()).hexdigest()
+
+def generated_is_fresh() -> bool:
+    """The generated module is reusable if it is newer than both the input and
+    the generator, was built from an input with the same content hash and is
+    still the source that was written for it."""
+    try:
+        generated_mtime = os.stat(generated_path).st_mtime_ns
+        with open(hash_path) as f:
+            stored_digests = f.read()
+        if (generated_mtime <= os.stat(aeronautical_json_path).st_mtime_ns
+                or generated_mtime <= os.stat(generator_path).st_mtime_ns):
+            return False
+        with open(generated_path, 'rb') as f:
+            source_digest = hashlib.blake2b(f.read()).hexdigest()
+    except FileNotFoundError:
+        return False
+    return stored_digests == f'{input_digest} {source_digest}'
+
+if not generated_is_fresh():
+    # Run generator with aeronautical.json and execute the source straight
+    # from memory, then persist it (hash last, so a partial write is never
+    # trusted) so the next run can skip generation
+    import generator
+    source = generator.main(aeronautical_json_path, return_source=True)
+
+    generated_module = types.ModuleType('generated_class')
+    sys.modules['generated_class'] = generated_module
+    exec(compile(source, generated_path, 'exec'), generated_module.__dict__)
+
+    # Written as bytes so the digest covers exactly what lands on disk, with
+    # no platform newline translation or locale encoding in between
+    source_bytes = source.encode()
+    with open(generated_path, 'wb') as f:
+        f.write(source_bytes)
+    with open(hash_path, 'w') as f:
+        f.write(f'{input_digest} {hashlib.blake2b(source_bytes).hexdigest()}')
 
 # Now import the generated class
 from generated_class import Aeronautical, RoutePoint